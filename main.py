@@ -1,21 +1,52 @@
-import itertools
+import mmap
 import os
+import re
 import concurrent.futures
-from functools import partial
+from functools import lru_cache, partial
+
+try:
+    import numpy as np
+except ImportError:  # fall back to the pure-Python filter below
+    np = None
 
 # Default file paths
 DICTIONARY_FILE = "words.txt"
 OUTPUT_FILE = "output.txt"
 ILLEGAL_COMBOS_FILE = "illegalcombos.txt"
 
+# Below this many words, pickling chunks to worker processes costs more than filtering them
+PARALLEL_THRESHOLD = 5000
+
+# Below this many rows, the NumPy path filters in one call rather than splitting across
+# threads, and skips Numba (its import and JIT cost more than masking a small matrix)
+ARRAY_PARALLEL_THRESHOLD = 1 << 16
+
 # --- Word checking ---
+def read_file_bytes(path):
+    """Read a whole file through mmap with sequential read-ahead hints.
+
+    The bytes are still copied out of the mapping before parsing, so this only
+    helps large files; for words.txt it is equivalent to read(). Falls back to
+    a plain read() where mmap is unavailable (or the file is empty).
+    """
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for advice in ("MADV_SEQUENTIAL", "MADV_WILLNEED"):
+                if hasattr(mmap, advice):
+                    mm.madvise(getattr(mmap, advice))
+            return mm.read()
+    except (OSError, ValueError):
+        with open(path, "rb") as f:
+            return f.read()
+
 def load_dictionary(word_length):
     """Load dictionary words of the given length."""
     if not os.path.exists(DICTIONARY_FILE):
         print(f"[!] Dictionary file '{DICTIONARY_FILE}' not found. Using brute force.")
         return None
-    with open(DICTIONARY_FILE, "r") as f:
-        words = {line.strip().lower() for line in f if len(line.strip()) == word_length}
+    # Lowercase the whole buffer in one call; splitlines() drops the terminators
+    data = read_file_bytes(DICTIONARY_FILE).lower()
+    words = {w.decode() for w in data.splitlines() if len(w) == word_length}
     print(f"Loaded {len(words)} words from dictionary.")
     return words
 
@@ -32,37 +63,373 @@ def load_illegal_combos():
     print(f"Loaded {len(combos)} illegal 2-letter combinations.")
     return combos
 
-def check_word(word, excluded_letters, required_letters, known_positions, forbidden_positions, dictionary=None, illegal_combos=None):
-    """Return True if word passes all constraints."""
-    if dictionary is not None and word not in dictionary:
-        return False
-    if any(ch in excluded_letters for ch in word):
-        return False
-    if not all(ch in word for ch in required_letters):
-        return False
-    for i, c in enumerate(known_positions):
-        if c is not None and word[i] != c:
-            return False
-    for letter, positions in forbidden_positions.items():
-        for pos in positions:
-            if pos < len(word) and word[pos] == letter:
-                return False
-    if illegal_combos:
-        for i in range(len(word)-1):
-            if word[i:i+2].lower() in illegal_combos:
-                return False
-    return True
-
-def filter_chunk(chunk, excluded_letters, required_letters, known_positions, forbidden_positions, dictionary, illegal_combos):
-    return [
-        w for w in chunk
-        if check_word(w, excluded_letters, required_letters, known_positions, forbidden_positions, dictionary, illegal_combos)
+def flatten_forbidden(forbidden_positions, word_length):
+    """Flatten {letter: {positions}} into sorted (pos, letter) pairs, built once per turn.
+
+    Positions outside the word and multi-character "letters" can never match
+    a single character, so they are dropped here.
+    """
+    return sorted(
+        (pos, letter)
+        for letter, positions in forbidden_positions.items() if len(letter) == 1
+        for pos in positions if 0 <= pos < word_length
+    )
+
+def build_regex(word_length, excluded_letters, known_positions, forbidden_pairs):
+    """Compile the positional constraints into one pattern for re.fullmatch.
+
+    Greens become literal characters; every other position becomes a negated
+    class of the excluded letters plus any yellows forbidden at that position
+    (forbidden_pairs as from flatten_forbidden).
+    """
+    banned_at = [set(excluded_letters) for _ in range(word_length)]
+    for pos, letter in forbidden_pairs:
+        banned_at[pos].add(letter)
+    parts = []
+    for i in range(word_length):
+        banned = banned_at[i]
+        c = known_positions[i]
+        if c is not None:
+            # A green that is also banned can never match
+            parts.append("(?!)" if c in banned else re.escape(c))
+        elif banned:
+            parts.append("[^" + "".join(re.escape(ch) for ch in sorted(banned)) + "]")
+        else:
+            parts.append(".")
+    return re.compile("".join(parts), re.DOTALL)
+
+# Set once per worker process by _init_worker so it is not re-pickled every turn
+_worker_illegal_combos = None
+
+def _init_worker(illegal_combos):
+    global _worker_illegal_combos
+    _worker_illegal_combos = frozenset(illegal_combos)
+
+def make_pool(illegal_combos):
+    return concurrent.futures.ProcessPoolExecutor(initializer=_init_worker, initargs=(illegal_combos,))
+
+def build_specialized_filter(word_length, pattern, required_letters, illegal_combos):
+    """Compile the turn's constraints into one list comprehension over a batch of words."""
+    conds = [f"{ch!r} in w" for ch in sorted(required_letters)]
+    conds.append("fullmatch(w)")
+    follow = {}
+    for pair in illegal_combos or ():
+        follow.setdefault(pair[0], set()).add(pair[1])
+    if follow:
+        # F maps a letter to the letters that may not follow it
+        conds += [f"w[{i+1}] not in F.get(w[{i}], E)" for i in range(word_length - 1)]
+    src = "def _filter(words):\n    return [w for w in words if " + " and ".join(conds) + "]\n"
+    namespace = {
+        "fullmatch": pattern.fullmatch,
+        "F": {a: frozenset(bs) for a, bs in follow.items()},
+        "E": frozenset(),
+    }
+    exec(src, namespace)
+    return namespace["_filter"]
+
+@lru_cache(maxsize=8)
+def _specialized_filter(word_length, pattern, required_key, illegal_combos):
+    # Generated functions cannot be pickled, so each worker builds and caches its own
+    return build_specialized_filter(word_length, pattern, required_key, illegal_combos)
+
+def filter_chunk(chunk, pattern, required_letters, word_length, illegal_combos=None):
+    """Filter words with a build_regex pattern, required letters and illegal pairs (default: the worker's)."""
+    if illegal_combos is None:
+        illegal_combos = _worker_illegal_combos
+    return _specialized_filter(word_length, pattern, "".join(sorted(required_letters)),
+                               frozenset(illegal_combos or ()))(chunk)
+
+# --- Letter bitmasks ---
+ALL_LETTERS_MASK = (1 << 26) - 1
+
+def letters_to_mask(letters):
+    """26-bit mask with bit (ord(ch) - 97) set for every a-z letter in letters."""
+    mask = 0
+    for ch in letters:
+        if "a" <= ch <= "z":
+            mask |= 1 << (ord(ch) - ord("a"))
+    return mask
+
+def allowed_letter_masks(word_length, excluded_letters, known_positions, forbidden_pairs):
+    """Per-position mask of the letters that can still appear there."""
+    excluded_mask = letters_to_mask(excluded_letters)
+    allowed = []
+    for i in range(word_length):
+        c = known_positions[i]
+        mask = letters_to_mask(c) if c is not None else ALL_LETTERS_MASK
+        allowed.append(mask & ~excluded_mask)
+    for pos, letter in forbidden_pairs:
+        allowed[pos] &= ~letters_to_mask(letter)
+    return allowed
+
+def illegal_next_masks(illegal_combos):
+    """For each letter, the mask of letters that may not directly follow it."""
+    illegal_next = [0] * 26
+    for pair in illegal_combos or ():
+        if "a" <= pair[0] <= "z":
+            illegal_next[ord(pair[0]) - ord("a")] |= letters_to_mask(pair[1])
+    return illegal_next
+
+# --- Brute force (pruned trie walk) ---
+def walk_candidates(word_length, allowed, required_letters, illegal_combos=None):
+    """Yield every a-z string allowed by the per-position masks.
+
+    This is a DFS over the implicit trie of the alphabet. A branch is cut as
+    soon as its letter is not allowed at that depth, it forms an illegal pair
+    with the previous letter, or too few positions remain to place the
+    required letters that are still missing.
+    """
+    if any(not "a" <= ch <= "z" for ch in required_letters):
+        return  # only a-z strings are generated, so a required non-letter matches nothing
+    illegal_next = illegal_next_masks(illegal_combos)
+
+    def walk(depth, prefix, req_remaining):
+        bits = allowed[depth]
+        if prefix:
+            bits &= ~illegal_next[ord(prefix[-1]) - ord("a")]
+        last = depth == word_length - 1
+        while bits:
+            low = bits & -bits
+            bits ^= low
+            remaining = req_remaining & ~low
+            if depth + 1 + remaining.bit_count() > word_length:
+                continue
+            word = prefix + chr(ord("a") + low.bit_length() - 1)
+            if last:
+                yield word
+            else:
+                yield from walk(depth + 1, word, remaining)
+
+    if word_length > 0:
+        yield from walk(0, "", letters_to_mask(required_letters))
+
+def bruteforce_chunk(first_mask, word_length, allowed, required_letters, illegal_combos=None):
+    """Worker task: walk_candidates restricted to the first letters in first_mask."""
+    if illegal_combos is None:
+        illegal_combos = _worker_illegal_combos
+    return list(walk_candidates(word_length, [first_mask & allowed[0]] + allowed[1:], required_letters, illegal_combos))
+
+# --- Vectorized filtering (NumPy) ---
+def words_to_array(words, word_length):
+    """Pack equal-length words into a (N, word_length) uint8 matrix."""
+    if not words:
+        return np.empty((0, word_length), dtype=np.uint8)
+    return np.frombuffer("".join(words).encode(), dtype=np.uint8).reshape(-1, word_length)
+
+def load_dictionary_array(word_length):
+    """load_dictionary as a word matrix, cached next to the dictionary.
+
+    The matrix is saved as e.g. words_5.npy and memory-mapped on later runs
+    while it is newer than the dictionary, so the text is not parsed again.
+    An unreadable or malformed cache is ignored and rebuilt.
+    """
+    cache_file = f"{os.path.splitext(DICTIONARY_FILE)[0]}_{word_length}.npy"
+    if os.path.exists(DICTIONARY_FILE) and os.path.exists(cache_file) \
+            and os.path.getmtime(cache_file) > os.path.getmtime(DICTIONARY_FILE):
+        try:
+            arr = np.load(cache_file, mmap_mode="r")
+        except (OSError, ValueError):
+            arr = None
+        if arr is not None and arr.dtype == np.uint8 and arr.ndim == 2 and arr.shape[1] == word_length:
+            print(f"Loaded {len(arr)} words from '{cache_file}'.")
+            return arr
+    dictionary = load_dictionary(word_length)
+    if dictionary is None:
+        return None
+    arr = words_to_array(sorted(dictionary), word_length)
+    # Write to a temporary file and rename it into place, so an interrupted run
+    # never leaves a truncated cache behind
+    tmp_file = cache_file + ".tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            np.save(f, arr)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # caching is only an optimization
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+    return arr
+
+def array_to_words(arr):
+    """Decode the rows of a uint8 word matrix back into strings."""
+    data = arr.tobytes().decode()
+    n = arr.shape[1]
+    return [data[i:i+n] for i in range(0, len(data), n)]
+
+def generate_bruteforce_blocks(word_length, allowed):
+    """Yield the a-z strings allowed by the per-position masks as uint8 word
+    matrices, one block per first letter, so callers can filter block by block.
+    """
+    letters = [
+        np.array([ord("a") + b for b in range(26) if mask >> b & 1], dtype=np.uint8)
+        for mask in allowed
     ]
+    # Cartesian product of the remaining positions, shared by every block
+    rest = np.empty((1, word_length - 1), dtype=np.uint8)
+    if word_length > 1:
+        grid = np.indices([len(l) for l in letters[1:]], dtype=np.uint8).reshape(word_length - 1, -1)
+        rest = np.stack([l[g] for l, g in zip(letters[1:], grid)], axis=1)
+    for first in letters[0]:
+        block = np.empty((len(rest), word_length), dtype=np.uint8)
+        block[:, 0] = first
+        block[:, 1:] = rest
+        yield block
+
+def letter_masks(arr):
+    """Letter-presence bitmask (see letters_to_mask) for every row of arr."""
+    masks = np.zeros(len(arr), dtype=np.uint32)
+    for i in range(arr.shape[1]):
+        col = arr[:, i]
+        # Non-letters shift into bit 31, which is cleared below
+        shift = np.where((col >= ord("a")) & (col <= ord("z")), col - ord("a"), 31)
+        masks |= np.uint32(1) << shift.astype(np.uint32)
+    return masks & np.uint32(ALL_LETTERS_MASK)
+
+def illegal_pair_table(illegal_combos):
+    """256x256 boolean lookup of illegal pairs, indexed directly by the two bytes.
+
+    Indexing by raw byte needs no subtraction and stays valid for rows that
+    contain characters outside a-z.
+    """
+    table = np.zeros((256, 256), dtype=bool)
+    for pair in illegal_combos:
+        a, b = ord(pair[0]), ord(pair[1])
+        if a < 256 and b < 256:
+            table[a, b] = True
+    return table
+
+def _filter_non_letters(arr, keep, excluded_letters, required_letters):
+    # Characters outside a-z have no bit in the letter masks, so compare them directly
+    for ch in excluded_letters:
+        if not "a" <= ch <= "z":
+            keep &= ~(arr == ord(ch)).any(axis=1)
+    for ch in required_letters:
+        if not "a" <= ch <= "z":
+            keep &= (arr == ord(ch)).any(axis=1)
+    return keep
+
+# Replaced by numba.prange when the kernel below is compiled
+prange = range
+
+def _filter_rows(arr, allowed, greens, required_bits, illegal_next):
+    """Row filter compiled by get_filter_njit; see filter_array for the constraint encoding."""
+    n, length = arr.shape
+    keep = np.empty(n, dtype=np.bool_)
+    for r in prange(n):
+        ok = True
+        wmask = 0
+        prev = -1
+        for i in range(length):
+            c = arr[r, i] - 97
+            if 0 <= c < 26:
+                bit = 1 << c
+                if (allowed[i] & bit) == 0 or (prev >= 0 and (illegal_next[prev] & bit) != 0):
+                    ok = False
+                    break
+                wmask |= bit
+                prev = c
+            else:
+                if greens[i] >= 0 and arr[r, i] != greens[i]:
+                    ok = False
+                    break
+                prev = -1
+        keep[r] = ok and (wmask & required_bits) == required_bits
+    return keep
+
+_filter_njit = None
+
+def get_filter_njit():
+    """Import Numba and compile _filter_rows on first use; None if Numba is unavailable."""
+    global _filter_njit, prange
+    if _filter_njit is None:
+        try:
+            import numba
+        except ImportError:
+            _filter_njit = False
+        else:
+            prange = numba.prange
+            _filter_njit = numba.njit(parallel=True, boundscheck=False, cache=True)(_filter_rows)
+    return _filter_njit or None
+
+def njit_filter_for(arr):
+    """The Numba kernel if arr is large enough to be worth it, else None."""
+    if np is None or len(arr) < ARRAY_PARALLEL_THRESHOLD:
+        return None
+    return get_filter_njit()
+
+def filter_array(arr, excluded_letters, required_letters, known_positions, forbidden_pairs,
+                 illegal_table=None, illegal_next=None, word_masks=None):
+    """Return a boolean mask of the rows of arr that pass all constraints.
+
+    illegal_table and illegal_next are illegal_pair_table and illegal_next_masks
+    (as a uint32 array), built once by the caller; None means no illegal pairs.
+    """
+    filter_njit = njit_filter_for(arr)
+    if filter_njit is not None:
+        # Per-position allowed-letter masks cover grays, greens and forbidden
+        # yellows; greens are also passed as bytes for rows with non-letters
+        allowed = allowed_letter_masks(arr.shape[1], excluded_letters, known_positions, forbidden_pairs)
+        greens = [ord(c) if c is not None else -1 for c in known_positions[:arr.shape[1]]]
+        keep = filter_njit(
+            arr, np.array(allowed, dtype=np.uint32), np.array(greens, dtype=np.int32),
+            letters_to_mask(required_letters),
+            illegal_next if illegal_next is not None else np.zeros(26, dtype=np.uint32)
+        )
+        # Forbidden yellows outside a-z have no bit in the allowed masks
+        for pos, letter in forbidden_pairs:
+            if not "a" <= letter <= "z":
+                keep &= arr[:, pos] != ord(letter)
+        return _filter_non_letters(arr, keep, excluded_letters, required_letters)
+    if word_masks is None:
+        word_masks = letter_masks(arr)
+    excluded_mask = np.uint32(letters_to_mask(excluded_letters))
+    required_mask = np.uint32(letters_to_mask(required_letters))
+    keep = (word_masks & excluded_mask) == 0
+    keep &= (word_masks & required_mask) == required_mask
+    keep = _filter_non_letters(arr, keep, excluded_letters, required_letters)
+    # One scratch mask is reused by every column test instead of allocating per constraint
+    scratch = np.empty(len(arr), dtype=bool)
+    for i, c in enumerate(known_positions):
+        if c is not None:
+            keep &= np.equal(arr[:, i], ord(c), out=scratch)
+    for pos, letter in forbidden_pairs:
+        keep &= np.not_equal(arr[:, pos], ord(letter), out=scratch)
+    if illegal_table is not None and arr.shape[1] > 1:
+        # One gather per adjacent pair of columns
+        keep &= ~illegal_table[arr[:, :-1], arr[:, 1:]].any(axis=1, out=scratch)
+    return keep
+
+def filter_array_threaded(executor, arr, *constraints, word_masks=None):
+    """filter_array over row slices of arr in a thread pool.
+
+    NumPy releases the GIL inside its loops, so threads scale without the
+    pickling a process pool would need; every slice is a view of arr.
+    """
+    if executor is None or len(arr) < ARRAY_PARALLEL_THRESHOLD or njit_filter_for(arr) is not None:
+        # Small matrices are not worth splitting; the Numba kernel is parallel already
+        return filter_array(arr, *constraints, word_masks=word_masks)
+    def filter_slice(span):
+        lo, hi = span
+        return filter_array(arr[lo:hi], *constraints,
+                            word_masks=None if word_masks is None else word_masks[lo:hi])
+
+    bounds = np.linspace(0, len(arr), os.cpu_count() + 1, dtype=np.intp)
+    return np.concatenate(list(executor.map(filter_slice, zip(bounds[:-1], bounds[1:]))))
 
 def save_words(possible_words):
-    with open(OUTPUT_FILE, "w") as f:
-        for w in possible_words:
-            f.write(w + "\n")
+    with open(OUTPUT_FILE, "wb") as f:
+        if possible_words:
+            f.write(b"\n".join(w.encode() for w in possible_words) + b"\n")
+
+def save_array(arr):
+    """save_words for a uint8 word matrix: append a newline column and write the buffer once."""
+    out = np.empty((arr.shape[0], arr.shape[1] + 1), dtype=np.uint8)
+    out[:, :-1] = arr
+    out[:, -1] = ord("\n")
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(out.tobytes())
 
 # --- Main Interactive Loop ---
 def main():
@@ -71,15 +438,29 @@ def main():
     use_dict = input("Use dictionary? (y/n): ").strip().lower()
 
     if use_dict == "y":
-        dictionary = load_dictionary(word_length)
-        possible_words = list(dictionary)
+        if np is not None:
+            possible_words = load_dictionary_array(word_length)
+        else:
+            possible_words = list(load_dictionary(word_length))
         use_bruteforce = False
     else:
-        dictionary = None
         possible_words = None  # don’t prebuild yet
         use_bruteforce = True
 
     illegal_combos = load_illegal_combos()
+    illegal_table = illegal_next = None
+    if np is not None:
+        # Lookup arrays for filter_array, built once rather than every turn
+        illegal_table = illegal_pair_table(illegal_combos)
+        illegal_next = np.array(illegal_next_masks(illegal_combos), dtype=np.uint32)
+    word_masks = None
+
+    # The pure-Python path filters small lists in-process and reuses one pool
+    # for large ones; workers receive the illegal combos once. The NumPy path
+    # uses threads instead.
+    executor = None
+    if np is not None:
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count())
 
     # Persistent constraints
     master_excluded = set()
@@ -104,13 +485,87 @@ def main():
             try:
                 letter, positions = fp.split(":")
                 positions = [int(p) for p in positions.split(",")] if "," in positions else [int(positions)]
-                if letter in forbidden_positions:
-                    forbidden_positions[letter].extend(positions)
-                else:
-                    forbidden_positions[letter] = positions
+                if any(not 0 <= p < word_length for p in positions):
+                    raise ValueError("position out of range")
+                forbidden_positions.setdefault(letter, set()).update(positions)
             except Exception:
                 print("Invalid format, try again.")
 
+        # Surviving words already satisfy the master constraints, so only what
+        # is new this turn can remove any of them
+        new_excluded = excluded_letters - master_excluded
+        new_required = required_letters - master_required
+        new_known_positions = [
+            known_positions[i] if known_positions[i] != master_known_positions[i] else None
+            for i in range(word_length)
+        ]
+        new_forbidden_positions = {
+            letter: positions - master_forbidden_positions.get(letter, set())
+            for letter, positions in forbidden_positions.items()
+        }
+        new_forbidden_pairs = flatten_forbidden(new_forbidden_positions, word_length)
+
+        if np is not None:
+            # Vectorized path: the whole candidate set lives in one uint8 matrix
+            if use_bruteforce and possible_words is None:
+                print("[*] Generating brute force candidates on the fly…")
+                allowed = allowed_letter_masks(word_length, new_excluded,
+                                               new_known_positions, new_forbidden_pairs)
+                # Filter each first-letter block as it is generated to bound peak memory
+                blocks = [
+                    block[filter_array_threaded(executor, block, new_excluded, new_required,
+                                                new_known_positions, new_forbidden_pairs,
+                                                illegal_table, illegal_next)]
+                    for block in generate_bruteforce_blocks(word_length, allowed)
+                ]
+                if blocks:
+                    possible_words = np.concatenate(blocks)
+                else:
+                    possible_words = np.empty((0, word_length), dtype=np.uint8)
+            else:
+                if njit_filter_for(possible_words) is not None:
+                    word_masks = None  # the Numba kernel builds its own letter masks
+                elif word_masks is None:
+                    # Depends only on the words, so it is computed once and subset each turn
+                    word_masks = letter_masks(possible_words)
+                keep = filter_array_threaded(
+                    executor, possible_words, new_excluded, new_required,
+                    new_known_positions, new_forbidden_pairs,
+                    illegal_table, illegal_next, word_masks=word_masks
+                )
+                possible_words = possible_words[keep]
+                if word_masks is not None:
+                    word_masks = word_masks[keep]
+        elif use_bruteforce and possible_words is None:
+            # Build brute force only after we have constraints
+            print("[*] Generating brute force candidates on the fly…")
+            allowed = allowed_letter_masks(word_length, new_excluded,
+                                           new_known_positions, new_forbidden_pairs)
+            # One task per first letter: the workers generate and prune their own
+            # subtree, so only the survivors cross the process boundary
+            first_masks = [1 << b for b in range(26) if allowed[0] >> b & 1]
+            executor = executor or make_pool(illegal_combos)
+            func = partial(bruteforce_chunk, word_length=word_length, allowed=allowed,
+                           required_letters=new_required)
+            possible_words = [w for sublist in executor.map(func, first_masks) for w in sublist]
+        else:
+            # Normal filtering on existing possible_words
+            pattern = build_regex(word_length, new_excluded,
+                                  new_known_positions, new_forbidden_pairs)
+            if len(possible_words) < PARALLEL_THRESHOLD:
+                possible_words = filter_chunk(possible_words, pattern, new_required, word_length, illegal_combos)
+            else:
+                executor = executor or make_pool(illegal_combos)
+                # About four chunks per worker balances the load; each chunk is
+                # already a batch of words, so chunksize=1 sends each one as its own task
+                chunk_size = -(-len(possible_words) // (os.cpu_count() * 4))
+                chunks = [possible_words[i:i+chunk_size]
+                          for i in range(0, len(possible_words), chunk_size)]
+                func = partial(filter_chunk, pattern=pattern, required_letters=new_required,
+                               word_length=word_length)
+                results = executor.map(func, chunks, chunksize=1)
+                possible_words = [w for sublist in results for w in sublist]
+
         # Merge into master constraints
         master_excluded.update(excluded_letters)
         master_required.update(required_letters)
@@ -118,52 +573,16 @@ def main():
             if known_positions[i] is not None:
                 master_known_positions[i] = known_positions[i]
         for letter, positions in forbidden_positions.items():
-            if letter in master_forbidden_positions:
-                master_forbidden_positions[letter].extend(positions)
-            else:
-                master_forbidden_positions[letter] = positions
+            master_forbidden_positions.setdefault(letter, set()).update(positions)
 
-        # Build brute force only after we have constraints
-        if use_bruteforce and possible_words is None:
-            print("[*] Generating brute force candidates on the fly…")
-            alphabet = "abcdefghijklmnopqrstuvwxyz"
-            # Instead of prebuilding the list, stream and filter immediately
-            def generate_candidates():
-                for p in itertools.product(alphabet, repeat=word_length):
-                    yield "".join(p)
-
-            candidates = generate_candidates()
-            # Filter as we stream:
-            possible_words = [
-                w for w in candidates
-                if check_word(w, master_excluded, master_required,
-                              master_known_positions, master_forbidden_positions,
-                              dictionary, illegal_combos)
-            ]
+        if np is not None:
+            save_array(possible_words)
         else:
-            # Normal filtering on existing possible_words
-            chunk_size = max(1, len(possible_words) // os.cpu_count())
-            chunks = [possible_words[i:i+chunk_size] for i in range(0, len(possible_words), chunk_size)]
-
-            with concurrent.futures.ProcessPoolExecutor() as executor:
-                func = partial(
-                    filter_chunk,
-                    excluded_letters=master_excluded,
-                    required_letters=master_required,
-                    known_positions=master_known_positions,
-                    forbidden_positions=master_forbidden_positions,
-                    dictionary=dictionary,
-                    illegal_combos=illegal_combos
-                )
-                results = executor.map(func, chunks)
-
-            possible_words = [w for sublist in results for w in sublist]
-
-        save_words(possible_words)
+            save_words(possible_words)
 
         print(f"\nPossible words remaining: {len(possible_words)}")
         if len(possible_words) <= 20:
-            print(possible_words)
+            print(array_to_words(possible_words) if np is not None else possible_words)
         else:
             print("Too many to display. Check output.txt.")
 
@@ -172,6 +591,8 @@ def main():
             break
         turn += 1
 
+    if executor is not None:
+        executor.shutdown()
     print(f"\nGame ended. Possible words saved to '{OUTPUT_FILE}'.")
 
 
@@ -0,0 +1,237 @@
+import contextlib
+import importlib.util
+import io
+import itertools
+import os
+import random
+import string
+import tempfile
+import unittest
+from unittest import mock
+
+import main
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+WORD_LENGTH = 5
+# Include a non-letter so the a-z bitmask shortcuts are exercised too
+ALPHABET = string.ascii_lowercase + "-"
+
+
+def reference_check(word, excluded, required, known, forbidden_pairs, combos):
+    """The original per-character check, used as the oracle."""
+    if any(ch in excluded for ch in word):
+        return False
+    if not all(ch in word for ch in required):
+        return False
+    if any(c is not None and word[i] != c for i, c in enumerate(known)):
+        return False
+    if any(word[pos] == letter for pos, letter in forbidden_pairs):
+        return False
+    return not any(word[i:i+2] in combos for i in range(len(word) - 1))
+
+
+def random_constraints(rng, words, word_length=WORD_LENGTH):
+    # Draw letters from a real word now and then so some constraints match
+    sample = rng.choice(words)
+    pick = lambda: rng.choice(sample) if rng.random() < 0.5 else rng.choice(ALPHABET)
+    excluded = {pick() for _ in range(rng.randint(0, 3))}
+    required = {pick() for _ in range(rng.randint(0, 2))}
+    known = [sample[i] if rng.random() < 0.15 else None for i in range(word_length)]
+    forbidden = {}
+    for _ in range(rng.randint(0, 2)):
+        forbidden.setdefault(pick(), set()).add(rng.randrange(word_length))
+    return excluded, required, known, main.flatten_forbidden(forbidden, word_length)
+
+
+def load_illegal_combos():
+    with open(os.path.join(HERE, main.ILLEGAL_COMBOS_FILE)) as f:
+        return {line.strip().lower() for line in f if len(line.strip()) == 2}
+
+
+def illegal_arrays(combos):
+    """The illegal_table and illegal_next arguments of filter_array, as main() builds them."""
+    return main.illegal_pair_table(combos), main.np.array(main.illegal_next_masks(combos), dtype=main.np.uint32)
+
+
+class FilterPathsTest(unittest.TestCase):
+    """The pure-Python, NumPy and Numba paths must agree with the reference check."""
+
+    @classmethod
+    def setUpClass(cls):
+        with open(os.path.join(HERE, main.DICTIONARY_FILE), "rb") as f:
+            lines = f.read().lower().splitlines()
+        words = sorted({w.decode() for w in lines if len(w) == WORD_LENGTH})
+        rng = random.Random(0)
+        words += ["".join(rng.choice(ALPHABET) for _ in range(WORD_LENGTH)) for _ in range(2000)]
+        cls.words = words
+        cls.combos = load_illegal_combos()
+
+    def cases(self, n=150):
+        rng = random.Random(1)
+        for _ in range(n):
+            yield random_constraints(rng, self.words)
+
+    def expected(self, excluded, required, known, forbidden_pairs):
+        return [w for w in self.words
+                if reference_check(w, excluded, required, known, forbidden_pairs, self.combos)]
+
+    def test_pure_python(self):
+        for excluded, required, known, forbidden_pairs in self.cases():
+            pattern = main.build_regex(WORD_LENGTH, excluded, known, forbidden_pairs)
+            got = main.filter_chunk(self.words, pattern, required, WORD_LENGTH, self.combos)
+            self.assertEqual(got, self.expected(excluded, required, known, forbidden_pairs),
+                             (excluded, required, known, forbidden_pairs))
+
+    def _check_array_path(self):
+        arr = main.words_to_array(self.words, WORD_LENGTH)
+        illegal = illegal_arrays(self.combos)
+        for excluded, required, known, forbidden_pairs in self.cases():
+            keep = main.filter_array(arr, excluded, required, known, forbidden_pairs, *illegal)
+            self.assertEqual(main.array_to_words(arr[keep]),
+                             self.expected(excluded, required, known, forbidden_pairs),
+                             (excluded, required, known, forbidden_pairs))
+
+    @unittest.skipIf(main.np is None, "NumPy is not installed")
+    def test_numpy(self):
+        with mock.patch.object(main, "_filter_njit", False):
+            self._check_array_path()
+
+    @unittest.skipIf(main.np is None or importlib.util.find_spec("numba") is None,
+                     "Numba is not installed")
+    def test_numba(self):
+        # The kernel is normally reserved for large matrices
+        with mock.patch.object(main, "ARRAY_PARALLEL_THRESHOLD", 0):
+            self.assertIsNotNone(main.njit_filter_for(self.words))
+            self._check_array_path()
+
+
+class BruteForceTest(unittest.TestCase):
+    """Every brute-force generator must match filtering all a-z strings with the reference check."""
+
+    LENGTH = 3
+
+    @classmethod
+    def setUpClass(cls):
+        cls.combos = load_illegal_combos()
+        cls.all_words = ["".join(p) for p in itertools.product(string.ascii_lowercase, repeat=cls.LENGTH)]
+
+    def cases(self, n=40):
+        yield set(), set(), [None] * self.LENGTH, []
+        # A green that is also gray rules out every word
+        yield {"a"}, set(), ["a", None, None], []
+        # Brute force only generates a-z, so a required non-letter matches nothing
+        yield set(), {"-"}, [None] * self.LENGTH, []
+        yield {"-"}, {"e"}, [None, None, "-"], [(1, "e")]
+        rng = random.Random(2)
+        for _ in range(n):
+            yield random_constraints(rng, self.all_words, self.LENGTH)
+
+    def expected(self, excluded, required, known, forbidden_pairs):
+        return [w for w in self.all_words
+                if reference_check(w, excluded, required, known, forbidden_pairs, self.combos)]
+
+    def test_walk_candidates(self):
+        for excluded, required, known, forbidden_pairs in self.cases():
+            allowed = main.allowed_letter_masks(self.LENGTH, excluded, known, forbidden_pairs)
+            got = list(main.walk_candidates(self.LENGTH, allowed, required, self.combos))
+            self.assertEqual(got, self.expected(excluded, required, known, forbidden_pairs),
+                             (excluded, required, known, forbidden_pairs))
+
+    def test_bruteforce_chunk(self):
+        for excluded, required, known, forbidden_pairs in self.cases():
+            allowed = main.allowed_letter_masks(self.LENGTH, excluded, known, forbidden_pairs)
+            got = []
+            for b in range(26):
+                got += main.bruteforce_chunk(1 << b, self.LENGTH, allowed, required, self.combos)
+            self.assertEqual(got, self.expected(excluded, required, known, forbidden_pairs),
+                             (excluded, required, known, forbidden_pairs))
+
+    def _check_blocks(self):
+        illegal = illegal_arrays(self.combos)
+        for excluded, required, known, forbidden_pairs in self.cases():
+            allowed = main.allowed_letter_masks(self.LENGTH, excluded, known, forbidden_pairs)
+            got = []
+            for block in main.generate_bruteforce_blocks(self.LENGTH, allowed):
+                keep = main.filter_array(block, excluded, required, known, forbidden_pairs, *illegal)
+                got += main.array_to_words(block[keep])
+            self.assertEqual(got, self.expected(excluded, required, known, forbidden_pairs),
+                             (excluded, required, known, forbidden_pairs))
+
+    @unittest.skipIf(main.np is None, "NumPy is not installed")
+    def test_numpy_blocks(self):
+        with mock.patch.object(main, "_filter_njit", False):
+            self._check_blocks()
+
+    @unittest.skipIf(main.np is None or importlib.util.find_spec("numba") is None,
+                     "Numba is not installed")
+    def test_numba_blocks(self):
+        with mock.patch.object(main, "ARRAY_PARALLEL_THRESHOLD", 0):
+            self._check_blocks()
+
+
+@unittest.skipIf(main.np is None, "NumPy is not installed")
+class DictionaryCacheTest(unittest.TestCase):
+    """load_dictionary_array writes words_<L>.npy once and reuses it while it is valid."""
+
+    WORDS = ["crane", "Slate", "trace", "ab", "toolong"]
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dictionary = os.path.join(tmp.name, "words.txt")
+        self.cache = os.path.join(tmp.name, "words_5.npy")
+        self.write_dictionary(self.WORDS)
+        patcher = mock.patch.object(main, "DICTIONARY_FILE", self.dictionary)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_dictionary(self, words):
+        with open(self.dictionary, "w") as f:
+            f.write("\n".join(words) + "\n")
+
+    def load(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return main.load_dictionary_array(5)
+
+    def make_cache_newer(self):
+        t = os.path.getmtime(self.dictionary) + 10
+        os.utime(self.cache, (t, t))
+
+    def assertRebuilt(self, arr, words=("crane", "slate", "trace")):
+        self.assertNotIsInstance(arr, main.np.memmap)
+        self.assertEqual(main.array_to_words(arr), list(words))
+        cached = main.np.load(self.cache)
+        self.assertEqual(main.array_to_words(cached), list(words))
+
+    def test_first_run_writes_cache(self):
+        self.assertRebuilt(self.load())
+        self.assertFalse(os.path.exists(self.cache + ".tmp"))
+
+    def test_second_run_memory_maps_cache(self):
+        self.load()
+        self.make_cache_newer()
+        arr = self.load()
+        self.assertIsInstance(arr, main.np.memmap)
+        self.assertEqual(main.array_to_words(arr), ["crane", "slate", "trace"])
+
+    def test_corrupted_cache_is_rebuilt(self):
+        with open(self.cache, "wb") as f:
+            f.write(b"not a numpy file")
+        self.make_cache_newer()
+        self.assertRebuilt(self.load())
+
+    def test_wrong_shape_cache_is_rebuilt(self):
+        main.np.save(self.cache, main.np.zeros((2, 4), dtype=main.np.uint8))
+        self.make_cache_newer()
+        self.assertRebuilt(self.load())
+
+    def test_stale_cache_is_ignored(self):
+        self.load()
+        self.write_dictionary(self.WORDS + ["zesty"])
+        t = os.path.getmtime(self.dictionary) - 10
+        os.utime(self.cache, (t, t))
+        self.assertRebuilt(self.load(), ["crane", "slate", "trace", "zesty"])
+
+
+if __name__ == "__main__":
+    unittest.main()